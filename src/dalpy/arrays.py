@@ -65,6 +65,17 @@ class Array:
             raise ValueError(f'length ({length}) can\'t be < 0')
         self.__buf = [None] * length
 
+    @classmethod
+    def _from_list(cls, ls):
+        # library-internal constructor from a copy of a list
+        a = cls(0)
+        a.__buf = list(ls)
+        return a
+
+    def _buffer(self):
+        # library-internal access to the backing list (not a copy)
+        return self.__buf
+
     def length(self):
         """Returns the integer length of this `Array` in `O(1)` time with respect to the length of the `Array`."""
         return len(self.__buf)
@@ -78,13 +89,20 @@ class Array:
         """
         self.__buf.sort()
 
+    # The common in bounds case is checked inline. Otherwise __check_index raises the IndexError, and anything it lets
+    # through (e.g. an index that is not an int) is left to the list to reject.
+
     def __getitem__(self, index):
-        self.__check_index(index)
-        return self.__buf[index]
+        buf = self.__buf
+        if not 0 <= index < len(buf):
+            self.__check_index(index)
+        return buf[index]
 
     def __setitem__(self, index, value):
-        self.__check_index(index)
-        self.__buf[index] = value
+        buf = self.__buf
+        if not 0 <= index < len(buf):
+            self.__check_index(index)
+        buf[index] = value
 
     def __iter__(self):
         # Disables the users' ability to do for e in a for an Array a. Without disabling this, the default Python
@@ -140,38 +158,50 @@ class Array2D:
         """
         if num_rows <= 0 or num_columns <= 0:
             raise ValueError(f'both num_rows ({num_rows}) and num_cols ({num_columns}) must be > 0')
-        self.__buf = list()
-        for _ in range(num_rows):
-            self.__buf.append([None] * num_columns)
+        # the elements are stored in one list, row after row, so element (row, column) is at row * num_columns + column
+        self.__rows = num_rows
+        self.__columns = num_columns
+        self.__buf = [None] * (num_rows * num_columns)
 
     def rows(self):
         """Returns integer number of rows in this `Array2D` in `O(1)` time w/r/t the dimensions of this `Array2D`."""
-        return len(self.__buf)
+        return self.__rows
 
     def columns(self):
         """Returns integer number of columns in this `Array2D` in `O(1)` time w/r/t the dimensions of this `Array2D`."""
-        return len(self.__buf[0])
+        return self.__columns
+
+    def _buffer(self):
+        # library-internal access to the backing list (not a copy), row after row
+        return self.__buf
 
     def __iter__(self):
         # Disables the users' ability to do for e in a for an Array2D a. Without disabling this, the default Python
         # __iter__ will try to call __getitem__ with an int leading to a TypeError which is somewhat confusing.
         raise RuntimeError('Not allowed to iterate over Array2D like an iterable. Must go through `[]` with indices.')
 
+    # The bounds checks are done inline in one condition, and only an out of bounds index goes through a further call to
+    # build the error.
+
     def __getitem__(self, index):
-        row, column = self.__get_row_and_column(index)
-        return self.__buf[row][column]
+        row, column = index
+        columns = self.__columns
+        if 0 <= row < self.__rows and 0 <= column < columns:
+            return self.__buf[row * columns + column]
+        self.__raise_index_error(row, column)
 
     def __setitem__(self, index, value):
-        row, column = self.__get_row_and_column(index)
-        self.__buf[row][column] = value
-
-    def __get_row_and_column(self, index):
         row, column = index
-        if row < 0 or row >= len(self.__buf):
-            raise IndexError(f'row index ({row}) can\'t be < 0 or >= num_rows ({len(self.__buf)})')
-        if column < 0 or column >= len(self.__buf[0]):
-            raise IndexError(f'column index ({column}) can\'t be < 0 or >= num_columns ({len(self.__buf[0])})')
-        return row, column
+        columns = self.__columns
+        if 0 <= row < self.__rows and 0 <= column < columns:
+            self.__buf[row * columns + column] = value
+        else:
+            self.__raise_index_error(row, column)
+
+    def __raise_index_error(self, row, column):
+        if row < 0 or row >= self.__rows:
+            raise IndexError(f'row index ({row}) can\'t be < 0 or >= num_rows ({self.__rows})')
+        raise IndexError(f'column index ({column}) can\'t be < 0 or >= num_columns ({self.__columns})')
 
 
 def sort(a):
@@ -191,8 +221,7 @@ def sort(a):
     """
     if not isinstance(a, Array):
         raise TypeError(f'can only sort Array objects')
-    copy = Array(a.length())
-    for i in range(a.length()):
-        copy[i] = a[i]
+    # the backing list is copied in one step, instead of element by element through the indexing operators
+    copy = Array._from_list(a._buffer())
     copy.sort()
     return copy
@@ -16,8 +16,7 @@ def make_queue(ls):
         ls: A `list` of elements to be enqueued into the `Queue`.
     """
     queue = Queue()
-    for x in ls:
-        queue.enqueue(x)
+    queue._extend(ls)
     return queue
 
 
@@ -28,8 +27,7 @@ def make_stack(ls):
         ls: A `list` of elements to be enqueued into the `Stack`.
     """
     s = Stack()
-    for e in ls:
-        s.push(e)
+    s._extend(ls)
     return s
 
 
@@ -39,15 +37,16 @@ def copy_stack(s):
     Args:
         s: The `Stack` to copy.
     """
-    buf = Stack()
-    while not s.is_empty():
-        nxt = s.pop()
-        buf.push(nxt)
-        buf.push(nxt)
+    # drain s once into a list (top first), then rebuild s and the copy from the bottom up. The bound methods are
+    # looked up once outside of the loop
+    buf = list()
+    append, pop = buf.append, s.pop
+    for _ in range(s.size()):
+        append(pop())
+    buf.reverse()
+    s._extend(buf)
     cpy = Stack()
-    while not buf.is_empty():
-        s.push(buf.pop())
-        cpy.push(buf.pop())
+    cpy._extend(buf)
     return cpy
 
 
@@ -57,10 +56,7 @@ def make_array(ls):
     Args:
         ls: The `list` of elements to insert into a new `Array`.
     """
-    a = Array(len(ls))
-    for i, e in enumerate(ls):
-        a[i] = e
-    return a
+    return Array._from_list(ls)
 
 
 def nary_add_children(root, children):
@@ -76,7 +72,7 @@ def nary_add_children(root, children):
     if len(children) == 0:
         return
     root.leftmost_child = children[0]
-    for i, child in enumerate(children):
+    for child in children:
         child.parent = root
-        if i < len(children) - 1:
-            child.right_sibling = children[i + 1]
+    for child, sibling in zip(children, children[1:]):
+        child.right_sibling = sibling
@@ -19,8 +19,9 @@ Examples:
         x = a['colour']
 """
 
+import sys
+
 from dalpy.sets import Set
-from dalpy.linked_lists import SinglyLinkedListNode as Node
 
 
 class VertexAttributeError(Exception):
@@ -34,8 +35,8 @@ class VertexAttributeError(Exception):
             wrong_attribute: String attribute that does not exist in the `Vertex` referred to by `name`.
             attributes: The valid attributes in the `Vertex` referred to by `name` as a `list` of `str`.
         """
-        super().__init__(
-            f'vertex {name} does not have attribute {wrong_attribute}, available attributes: [{", ".join(a for a in attributes)}]')
+        super().__init__(f'vertex {name} does not have attribute {wrong_attribute}, available attributes: '
+                         f'[{", ".join(a for a in attributes)}]')
 
 
 class Vertex:
@@ -69,6 +70,9 @@ class Vertex:
         type is not `str`, a `TypeError` will be raised (e.g. calling `v[1] = 'blue'`).
     """
 
+    # __dict__ is kept so that other attributes can still be set on a Vertex directly
+    __slots__ = ('__name', '__attributes', '__hash', '__dict__')
+
     def __init__(self, name, **attributes):
         """Initializes a `Vertex`.
 
@@ -78,30 +82,43 @@ class Vertex:
             **attributes: Optional keyword arguments specifying attributes you want the `Vertex` to start with. See
                           the class docstring above for some possible attributes you could add.
         """
-        self.__name = name
-        self.__attributes = attributes
+        # interning str names lets __eq__ usually decide equality with an identity check
+        self.__name = sys.intern(name) if type(name) is str else name
+        # most vertices are created without attributes, so only keep a dict once there is something to put in it
+        self.__attributes = attributes if attributes else None
+        # names can't be changed after construction, so the hash used for every Graph lookup can be computed once
+        self.__hash = hash(name)
 
     def get_name(self):
         """Returns the name of this `Vertex`."""
         return self.__name
 
     def __getitem__(self, attribute):
-        if attribute not in self.__attributes:
-            raise VertexAttributeError(self.__name, attribute, self.__attributes)
-        return self.__attributes[attribute]
+        # a single dict lookup on the hit path, which is what graph algorithms do on every color/time read
+        if self.__attributes is not None:
+            try:
+                return self.__attributes[attribute]
+            except KeyError:
+                pass
+        raise VertexAttributeError(self.__name, attribute, self.__attributes or ())
 
     def __setitem__(self, attribute, value):
+        if self.__attributes is None:
+            self.__attributes = dict()
         if attribute not in self.__attributes and not isinstance(attribute, str):
             raise TypeError(f'attribute {attribute} is not of type str, has type {type(attribute)}')
         self.__attributes[attribute] = value
 
     def __hash__(self):
-        return hash(self.__name)
+        return self.__hash
 
     def __eq__(self, other):
+        # dict lookups compare a key with itself far more often than with another Vertex
+        if other is self:
+            return True
         if not isinstance(other, Vertex):
             return False
-        return other.__name == self.__name
+        return other.__name is self.__name or other.__name == self.__name
 
     def __iter__(self):
         # Disables the users' ability to do for a in v for an Vertex v. Without disabling this, the default Python
@@ -170,10 +187,50 @@ class Graph:
             s = g.adj(a)
     """
 
+    # __dict__ is kept so that a Graph can still be given other attributes, e.g. a time counter for DFS
+    __slots__ = ('_adj', '__dict__')
+
     def __init__(self):
         """Initializes an empty `Graph` in `O(1)` time."""
-        self.__adj_lists = dict()
-        self.__edge_weights = dict()
+        # maps each vertex to a dict of its adjacent vertices and the weights of the edges to them. dicts preserve
+        # insertion order, so adjacent vertices are kept in the order their edges were added
+        self._adj = dict()
+
+    @classmethod
+    def from_edges(cls, vertices, edges):
+        """Creates a `Graph` from a collection of vertices and a collection of edges.
+
+        This builds the same `Graph` as calling `add_vertex` on each `Vertex` followed by `add_edge` on each edge, but
+        does so in a single pass without calling those methods. This runs in `O(V + E)` time where `V` is the number of
+        vertices and `E` is the number of edges.
+
+        Args:
+            vertices: An iterable (e.g. a `list` or `dalpy.sets.Set`) of `Vertex` objects. They are added in the order
+                      they are produced.
+            edges: An iterable of `tuple`s of the form `(source, dest)` or `(source, dest, weight)` specifying the edges
+                   to add in order. An edge without a weight has weight `None`.
+
+        Returns:
+            A new `Graph` with the given vertices and edges.
+
+        Raises:
+            GraphVertexError: If the source or destination `Vertex` of an edge is not in `vertices`.
+
+        Examples:
+            To create a `Graph` with vertices `a`, `b`, `c`, an edge from `a` to `b` with weight 1, and an edge from
+            `b` to `c` with no weight:
+
+                g = Graph.from_edges([a, b, c], [(a, b, 1), (b, c)])
+        """
+        g = cls()
+        adj = g._adj
+        for vertex in vertices:
+            adj[vertex] = dict()
+        for edge in edges:
+            source, dest = edge[0], edge[1]
+            g._check_edge_vertices(source, dest)
+            adj[source][dest] = edge[2] if len(edge) > 2 else None
+        return g
 
     def add_vertex(self, vertex):
         """Adds a `Vertex` to this `Graph`.
@@ -183,7 +240,7 @@ class Graph:
         Args:
             vertex: The `Vertex` to be added to this `Graph`.
         """
-        self.__adj_lists[vertex] = None
+        self._adj[vertex] = dict()
 
     def add_edge(self, source, dest, weight=None):
         """Adds an edge between 2 `Vertex` objects in this `Graph`.
@@ -201,11 +258,8 @@ class Graph:
         Raises:
             GraphVertexError: If `source` or `dest` is not in this `Graph`.
         """
-        self.__check_edge_vertices(source, dest)
-        self.__edge_weights[(source, dest)] = weight
-        # representation of adjacent lists using SLL vs. list allows for O(1) additions always without causing
-        # runtime degradation for adj()
-        self.__adj_lists[source] = Node(data=dest, next_node=self.__adj_lists[source])
+        self._check_edge_vertices(source, dest)
+        self._adj[source][dest] = weight
 
     def adj(self, vertex):
         """Gets the `Vertex` objects that are adjacent to a `Vertex`.
@@ -241,15 +295,58 @@ class Graph:
             The `dalpy.sets.Set` returned by `g.adj(a)` will always have `b` preceding `c` since the edge from `a`
             to `b` was created before the edge from `a` to `c`.
         """
-        if vertex not in self.__adj_lists:
+        if vertex not in self._adj:
+            raise GraphVertexError(vertex.get_name())
+        return Set.from_iterable(self._adj[vertex])
+
+    def neighbors(self, vertex):
+        """Gets an iterator over the `Vertex` objects that are adjacent to a `Vertex`.
+
+        Unlike `adj`, this does not build a `dalpy.sets.Set`, so it is the faster choice when the adjacent vertices
+        only need to be looped over once (e.g. in BFS or DFS). The vertices are produced in the same order as in the
+        `dalpy.sets.Set` returned by `adj`. Edges going out of `vertex` must not be added while iterating. Creating
+        the iterator runs in `O(1)` time with respect to the number of vertices and edges in this `Graph`.
+
+        Args:
+            vertex: A `Vertex`.
+
+        Returns:
+            An iterator over the vertices adjacent to `vertex`.
+
+        Raises:
+            GraphVertexError: If `vertex` is not in this `Graph`.
+
+        Examples:
+            To loop over the vertices adjacent to a `Vertex` `a` in a `Graph` `g`:
+
+                for v in g.neighbors(a):
+                    # Do something with v
+        """
+        if vertex not in self._adj:
+            raise GraphVertexError(vertex.get_name())
+        return iter(self._adj[vertex])
+
+    def adj_with_weights(self, vertex):
+        """Gets the `Vertex` objects that are adjacent to a `Vertex` along with the weights of the edges to them.
+
+        This is useful for algorithms such as Dijkstra's that need the weight of every edge leaving a `Vertex`, as it
+        avoids calling `weight` once per adjacent `Vertex`. The pairs are ordered the same way as the
+        `dalpy.sets.Set` returned by `adj`. This method runs in `O(n)` time where `n` is the number of edges going out
+        of the input `Vertex`.
+
+        Args:
+            vertex: A `Vertex`.
+
+        Returns:
+            A `list` of `(Vertex, weight)` `tuple`s, one for each edge going out of `vertex`. A weight will be `None` if
+            no weight was specified when the edge was created.
+
+        Raises:
+            GraphVertexError: If `vertex` is not in this `Graph`.
+        """
+        if vertex not in self._adj:
             raise GraphVertexError(vertex.get_name())
-        # add adjacent vertices to list before initializing Set (faster to avoid using union())
-        ls = list()
-        curr = self.__adj_lists[vertex]
-        while curr:
-            ls.append(curr.data)
-            curr = curr.next
-        return Set(*ls)
+        return list(self._adj[vertex].items())
 
     def weight(self, source, dest):
         """Gets the weight of an edge defined by two vertices.
@@ -268,10 +365,11 @@ class Graph:
             GraphVertexError: If `source` or `dest` is not in this `Graph`.
             GraphEdgeError: If an edge from `source` to `dest` does not exist.
         """
-        self.__check_edge_vertices(source, dest)
-        if (source, dest) not in self.__edge_weights:
-            raise GraphEdgeError(source, dest)
-        return self.__edge_weights[(source, dest)]
+        self._check_edge_vertices(source, dest)
+        try:
+            return self._adj[source][dest]
+        except KeyError:
+            raise GraphEdgeError(source, dest) from None
 
     def vertices(self):
         """Gets the vertices in this `Graph`.
@@ -283,10 +381,10 @@ class Graph:
             `dalpy.sets.Set` will always be the order in which the vertices were added to this `Graph` via
             `add_vertex`.
         """
-        return Set(*self.__adj_lists)
+        return Set.from_iterable(self._adj)
 
-    def __check_edge_vertices(self, source, dest):
-        if source not in self.__adj_lists:
+    def _check_edge_vertices(self, source, dest):
+        if source not in self._adj:
             raise GraphVertexError(source.get_name())
-        if dest not in self.__adj_lists:
+        if dest not in self._adj:
             raise GraphVertexError(dest.get_name())
@@ -90,9 +90,10 @@ class HashTable:
         Raises:
             KeyError: If `key` is not in this `HashTable`.
         """
-        if key not in self.__table:
-            raise KeyError(f'{key} not in table')
-        return self.__table[key]
+        try:
+            return self.__table[key]
+        except KeyError:
+            raise KeyError(f'{key} not in table') from None
 
     def delete(self, key):
         """Removes the key-value pair with a particular key in the `HashTable`.
@@ -109,9 +110,10 @@ class HashTable:
         Raises:
             KeyError: If `key` is not in this `HashTable`.
         """
-        if key not in self.__table:
-            raise KeyError(f'cannot delete {key} as it does not exist in table')
-        return self.__table.pop(key)
+        try:
+            return self.__table.pop(key)
+        except KeyError:
+            raise KeyError(f'cannot delete {key} as it does not exist in table') from None
 
     def keys(self):
         """Returns a `Set` of keys in the `HashTable`.
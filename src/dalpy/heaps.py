@@ -63,10 +63,33 @@ class PriorityQueue:
             q.decrease_key('a', 0)
     """
 
+    __slots__ = ('_buf', '_indices', '__dict__')
+
     def __init__(self):
         """Initializes an empty `PriorityQueue` in `O(1)` time."""
-        self.__buf = list()
-        self.__indices = dict()
+        self._buf = list()
+        self._indices = dict()
+
+    @classmethod
+    def from_iterable(cls, pairs):
+        """Creates a `PriorityQueue` from a collection of elements and their priorities.
+
+        This builds the heap all at once, which runs in `O(n)` time where `n` is the number of pairs, as opposed to the
+        `O(n * log(n))` time it takes to call `insert` on each pair.
+
+        Args:
+            pairs: An iterable of `(element, priority)` `tuple`s, where each `element` and `priority` are as in
+                   `insert`.
+
+        Returns:
+            A new `PriorityQueue` containing the elements of `pairs` with their associated priorities.
+
+        Raises:
+            ValueError: If an element occurs more than once in `pairs`.
+        """
+        q = cls()
+        q._insert_all(pairs)
+        return q
 
     def insert(self, element, priority):
         """Inserts an element into the `PriorityQueue` with an associated priority.
@@ -77,14 +100,32 @@ class PriorityQueue:
             element: An element to add to this `PriorityQueue`. This can be of any type.
             priority: The integer priority `element` should have in this `PriorityQueue`.
         """
-        if element in self.__indices:
+        if element in self._indices:
             raise ValueError(f'{element} already is in the PriorityQueue, to decrease its priority, use decrease_key()')
         # adding new item to end of list, usually O(1), could degrade to O(n) if resize needed but resizes will have to
         # happen regardless using any array-like structure to back a heap
-        self.__buf.append((priority, element))
-        # add new element as an entry into indices map (needed before _heapify_up which uses _swap which uses the map)
-        self.__indices[element] = len(self.__buf) - 1
-        self._heapify_up(len(self.__buf) - 1)
+        buf = self._buf
+        buf.append((priority, element))
+        # _heapify_up records the new element's final index in the indices map
+        self._heapify_up(len(buf) - 1)
+
+    def insert_many(self, pairs):
+        """Inserts a collection of elements, each with an associated priority, into this `PriorityQueue`.
+
+        Unless only a few elements are inserted into a much larger `PriorityQueue`, the heap is rebuilt once after all
+        the elements are added. This runs in `O(min(n + k, k * log(n + k)))` time where `n` is the size of this
+        `PriorityQueue` and `k` is the number of pairs, whereas calling `insert` on each pair always takes
+        `O(k * log(n + k))` time.
+
+        Args:
+            pairs: An iterable of `(element, priority)` `tuple`s, where each `element` and `priority` are as in
+                   `insert`.
+
+        Raises:
+            ValueError: If an element occurs more than once in `pairs` or is already in this `PriorityQueue`. In this
+                        case, none of the elements in `pairs` are inserted.
+        """
+        self._insert_all(pairs)
 
     def extract_min(self):
         """Removes the minimum priority element of this `PriorityQueue`.
@@ -97,16 +138,36 @@ class PriorityQueue:
         Raises:
              PriorityQueueUnderflowError: If this `PriorityQueue` is empty.
         """
-        if len(self.__buf) == 0:
+        if not self._buf:
             raise PriorityQueueUnderflowError('extract_min()')
-        # after swapping min element with bottom heap element, immediately remove it from heap so that it is not
-        # part of the _heapify_down. note that pop(-1) on list is O(1)
-        self._swap(0, len(self.__buf) - 1)
-        out = self.__buf.pop(-1)[1]
-        self.__indices.pop(out)
-        self._heapify_down(0)
+        # remove the bottom heap element (pop(-1) on list is O(1)) and, unless it was the min element itself, move it
+        # into the root before sifting it down
+        buf = self._buf
+        out = buf[0][1]
+        last = buf.pop(-1)
+        self._indices.pop(out)
+        if buf:
+            buf[0] = last
+            self._heapify_down(0)
         return out
 
+    def meld(self, other):
+        """Inserts all the elements of another `PriorityQueue` into this `PriorityQueue`.
+
+        The elements keep the priorities they have in the other `PriorityQueue`, which is not modified. This runs in
+        `O(min(n + m, m * log(n + m)))` time where `n` and `m` are the sizes of this and the other `PriorityQueue`.
+
+        Args:
+            other: The `PriorityQueue` whose elements are added to this one.
+
+        Raises:
+            TypeError: If `other` is not a `PriorityQueue`.
+            ValueError: If an element of `other` is already in this `PriorityQueue`.
+        """
+        if not isinstance(other, PriorityQueue):
+            raise TypeError('can only meld a PriorityQueue with another PriorityQueue')
+        self._insert_all((element, priority) for priority, element in other._buf)
+
     def minimum(self):
         """Gets the minimum priority element of this `PriorityQueue`.
 
@@ -118,9 +179,9 @@ class PriorityQueue:
         Raises:
              PriorityQueueUnderflowError: If this `PriorityQueue` is empty.
         """
-        if len(self.__buf) == 0:
+        if not self._buf:
             raise PriorityQueueUnderflowError('minimum()')
-        return self.__buf[0][1]
+        return self._buf[0][1]
 
     def decrease_key(self, element, new_priority):
         """Decreases the priority of an element in this `PriorityQueue`.
@@ -135,13 +196,14 @@ class PriorityQueue:
             ValueError: If `element` is not in this `PriorityQueue` or `new_priority` is greater than the existing
                         priority of `element`.
         """
-        if element not in self.__indices:
+        idx = self._indices.get(element)
+        if idx is None:
             raise ValueError(f'{element} is not in PriorityQueue, it must be inserted with insert()')
-        idx = self.__indices[element]
-        if new_priority > self.__buf[idx][0]:
+        buf = self._buf
+        if new_priority > buf[idx][0]:
             raise ValueError(
-                f'{element} has priority {self.__buf[idx][0]} < new_priority = {new_priority} (not a decrease)')
-        self.__buf[idx] = (new_priority, element)
+                f'{element} has priority {buf[idx][0]} < new_priority = {new_priority} (not a decrease)')
+        buf[idx] = (new_priority, element)
         self._heapify_up(idx)
 
     def size(self):
@@ -150,7 +212,7 @@ class PriorityQueue:
         Returns:
             The integer number of elements in this `PriorityQueue`.
         """
-        return len(self.__buf)
+        return len(self._buf)
 
     def is_empty(self):
         """Returns whether this `PriorityQueue` is empty in `O(1)` time w/r/t the size of this `PriorityQueue`.
@@ -158,37 +220,75 @@ class PriorityQueue:
         Returns:
             `True` if this `PriorityQueue` is empty, `False` otherwise.
         """
-        return len(self.__buf) == 0
+        return not self._buf
 
     # private class, instance methods
 
-    @staticmethod
-    def _parent(i):
-        return int((i - 1) / 2)
-
-    def _swap(self, i, j):
-        tmp = self.__buf[i]
-        self.__indices[self.__buf[i][1]] = j
-        self.__buf[i] = self.__buf[j]
-        self.__indices[self.__buf[j][1]] = i
-        self.__buf[j] = tmp
+    def _insert_all(self, pairs):
+        buf = self._buf
+        indices = self._indices
+        entries = [(priority, element) for element, priority in pairs]
+        # check everything before modifying the heap so that a duplicate leaves this PriorityQueue unchanged
+        new_elements = set()
+        for _, element in entries:
+            if element in indices or element in new_elements:
+                raise ValueError(f'{element} already is in the PriorityQueue, to decrease its priority, use '
+                                 f'decrease_key()')
+            new_elements.add(element)
+        n = len(buf)
+        buf.extend(entries)
+        if len(entries) * len(buf).bit_length() <= len(buf):
+            # a few entries into a large heap: sifting each one up (at most log(n + k) levels each) is cheaper than
+            # rebuilding the whole heap
+            for i in range(n, len(buf)):
+                self._heapify_up(i)
+        else:
+            # rebuild the heap bottom-up in O(n) (only _heapify_down moves entries, so record every index first)
+            for i in range(n, len(buf)):
+                indices[buf[i][1]] = i
+            for i in reversed(range(len(buf) // 2)):
+                self._heapify_down(i)
+
+    # Both sifts leave a "hole" where the moving entry started: entries it passes are shifted into the hole one at a
+    # time, and the moving entry is written once at its final index, instead of swapping pairs of entries per level.
 
     def _heapify_up(self, i):
-        while i > 0 and self.__buf[i][0] < self.__buf[PriorityQueue._parent(i)][0]:
-            self._swap(i, PriorityQueue._parent(i))
-            i = PriorityQueue._parent(i)
+        buf = self._buf
+        indices = self._indices
+        entry = buf[i]
+        priority = entry[0]
+        while i > 0:
+            parent = (i - 1) >> 1
+            if not priority < buf[parent][0]:
+                break
+            buf[i] = buf[parent]
+            indices[buf[i][1]] = i
+            i = parent
+        buf[i] = entry
+        indices[entry[1]] = i
 
     def _heapify_down(self, i):
+        buf = self._buf
+        indices = self._indices
+        n = len(buf)
+        # the priority of the element being moved down does not change, so it is read once. At each level the smaller
+        # child's priority is kept from the child comparison and reused when comparing against the moving element
+        entry = buf[i]
+        priority = entry[0]
         left = 2 * i + 1
-        right = 2 * i + 2
-        smallest = i
-        if left < len(self.__buf) and self.__buf[left][0] < self.__buf[i][0]:
-            smallest = left
-        if right < len(self.__buf) and self.__buf[right][0] < self.__buf[smallest][0]:
-            smallest = right
-        if smallest != i:
-            self._swap(smallest, i)
-            self._heapify_down(smallest)
+        while left < n:
+            smallest, smallest_priority = left, buf[left][0]
+            right = left + 1
+            if right < n and buf[right][0] < smallest_priority:
+                smallest, smallest_priority = right, buf[right][0]
+            if not smallest_priority < priority:
+                break
+            buf[i] = buf[smallest]
+            indices[buf[i][1]] = i
+            i = smallest
+            left = 2 * i + 1
+        buf[i] = entry
+        indices[entry[1]] = i
 
 
 def build_min_heap(arr):
@@ -206,7 +306,4 @@ def build_min_heap(arr):
     """
     if not isinstance(arr, Array):
         raise TypeError('can only build min heap of an Array')
-    ls = [arr[i] for i in range(arr.length())]
-    heapify(ls)
-    for i in range(arr.length()):
-        arr[i] = ls[i]
+    heapify(arr._buffer())
@@ -29,6 +29,9 @@ class SinglyLinkedListNode:
         next: A `SinglyLinkedListNode` representing the node that follows it this node in a singly linked list.
     """
 
+    # __dict__ is kept so that extra fields can still be set on a node
+    __slots__ = ('data', 'next', '__dict__')
+
     def __init__(self, data=None, next_node=None):
         """Initializes a `SinglyLinkedListNode` in `O(1)` time.
 
@@ -51,6 +54,8 @@ class DoublyLinkedListNode:
         prev: A `DoublyLinkedListNode` representing the node that precedes this node in a doubly linked list.
     """
 
+    __slots__ = ('data', 'prev', 'next', '__dict__')
+
     def __init__(self, data=None, next_node=None, prev_node=None):
         """Initializes a doubly linked list node in `O(1)` time.
 
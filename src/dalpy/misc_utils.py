@@ -4,21 +4,18 @@ Currently, this module holds utilities only related to mathematical operations,
 of Python that should be wrapped into DALPy could be added here (e.g. related to strings).
 """
 
-import sys
 import math
 
-INF = sys.maxsize
-"""Integer constant representing infinity."""
+INF = math.inf
+"""Constant representing infinity. It is greater than every integer and float other than itself, and `INF + x == INF`
+for any finite number `x`."""
 
-NEG_INF = -sys.maxsize
-"""Integer constant representing negative infinity."""
+NEG_INF = -math.inf
+"""Constant representing negative infinity. It is less than every integer and float other than itself, and
+`NEG_INF + x == NEG_INF` for any finite number `x`."""
 
+ceil = math.ceil
+"""Returns x rounded up to the nearest integer."""
 
-def ceil(x):
-    """Returns x rounded up to the nearest integer."""
-    return math.ceil(x)
-
-
-def floor(x):
-    """Returns x truncated."""
-    return math.floor(x)
+floor = math.floor
+"""Returns x truncated."""
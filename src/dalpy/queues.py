@@ -69,7 +69,7 @@ class Queue:
         Raises:
              QueueUnderflowError: If this `Queue` is empty.
         """
-        if len(self.__buf) == 0:
+        if not self.__buf:
             raise QueueUnderflowError('front()')
         return self.__buf[0]
 
@@ -85,7 +85,7 @@ class Queue:
         Raises:
              QueueUnderflowError: If this `Queue` is empty.
         """
-        if len(self.__buf) == 0:
+        if not self.__buf:
             raise QueueUnderflowError('dequeue()')
         return self.__buf.popleft()
 
@@ -99,9 +99,17 @@ class Queue:
         """
         self.__buf.append(value)
 
+    def _extend(self, values):
+        # library-internal bulk enqueue, used by dalpy.factory_utils
+        self.__buf.extend(values)
+
+    def _buffer(self):
+        # library-internal access to the backing deque (not a copy), front first
+        return self.__buf
+
     def is_empty(self):
         """Returns `True` if this `Queue` is empty, `False` otherwise in `O(1)` time w/r/t the size of this `Queue`."""
-        return len(self.__buf) == 0
+        return not self.__buf
 
     def size(self):
         """Returns the integer number of elements in this `Queue` in `O(1)` time w/r/t the size of this `Queue`."""
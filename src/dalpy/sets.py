@@ -45,9 +45,12 @@ class Set:
             t = Set(2,3)
             s.difference(t)
 
-        To remove one element from `s`, make use of the ability to create a singleton set combined with difference:
+        To remove one element from `s`, use discard:
 
-            s.difference(Set(1))
+            s.discard(1)
+
+        This has the same effect as combining a singleton set with difference, `s.difference(Set(1))`, without
+        creating the singleton set.
 
         To iterate over a `Set`:
 
@@ -55,6 +58,8 @@ class Set:
                 # Do something with e
     """
 
+    __slots__ = ('__set', '__dict__')
+
     def __init__(self, *initial_elements):
         """Initializes a `Set` in `O(1)` time.
 
@@ -66,9 +71,25 @@ class Set:
         # https://docs.python.org/3/library/stdtypes.html#dict
         # Dictionaries preserve insertion order. Note that updating a key does not affect the order.
         # Keys added after deletion are inserted at the end.
-        self.__set = dict()
-        for initial_element in initial_elements:
-            self.__set[initial_element] = None
+        self.__set = dict.fromkeys(initial_elements)
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """Creates a `Set` containing the elements of an iterable.
+
+        This is equivalent to `Set(*iterable)` but does not need to unpack the iterable into arguments first. The
+        elements are added in the order they are produced by the iterable. This runs in `O(n)` time where `n` is the
+        number of elements in the iterable.
+
+        Args:
+            iterable: An iterable (e.g. a `list`) of elements to initialize the `Set` with.
+
+        Returns:
+            A new `Set` containing the elements of `iterable`.
+        """
+        s = cls()
+        s.__set = dict.fromkeys(iterable)
+        return s
 
     def union(self, other_set):
         """Performs a set union operation on this `Set`.
@@ -92,7 +113,8 @@ class Set:
         """Performs a set difference operation on this `Set`.
 
         This method removes all the elements from this `Set` that occur in another set. Calling `s.difference(Set(1))`
-        on a `Set` `s` is akin to `s = s - {1}`. This runs in `O(n)` time where `n` is the size of the other `Set`.
+        on a `Set` `s` is akin to `s = s - {1}`. This runs in `O(min(n, m))` time where `n` and `m` are the sizes of this
+        `Set` and the other `Set`.
 
         Args:
             other_set: Another `Set` specifying the elements to be removed from this `Set`. This `Set` is unaffected by
@@ -103,13 +125,39 @@ class Set:
         """
         if not isinstance(other_set, Set):
             raise TypeError(f'can only perform set difference between Sets')
-        for k in other_set.__set:
-            if k in self.__set:
-                self.__set.pop(k)
+        # both backing dicts are loaded into locals once rather than looked up through the instances in each branch
+        elements = self.__set
+        other = other_set.__set
+        if not elements or not other:
+            return
+        if other is elements:
+            elements.clear()
+        elif len(other) == 1:
+            (k,) = other
+            elements.pop(k, None)
+        elif len(elements) < len(other):
+            # keep the elements of this (smaller) Set that are not in the other one, in their original order
+            self.__set = {k: None for k in elements if k not in other}
+        else:
+            # pop with a default removes an element if it is present in a single lookup
+            pop = elements.pop
+            for k in other:
+                pop(k, None)
+
+    def discard(self, element):
+        """Removes an element from this `Set` if it is present.
+
+        Calling `s.discard(1)` on a `Set` `s` is akin to `s = s - {1}`, and is equivalent to `s.difference(Set(1))`.
+        Nothing happens if the element is not in this `Set`. This runs in `O(1)` time w/r/t the size of this `Set`.
+
+        Args:
+            element: The element to be removed from this `Set`.
+        """
+        self.__set.pop(element, None)
 
     def is_empty(self):
         """Returns `True` if this `Set` is empty, `False` otherwise in `O(1)` time w/r/t the size of this `Set`."""
-        return len(self.__set) == 0
+        return not self.__set
 
     def size(self):
         """Returns the integer number of elements in this `Set` in `O(1)` time w/r/t the size of this `Set`."""
@@ -119,4 +167,4 @@ class Set:
         return element in self.__set
 
     def __iter__(self):
-        yield from self.__set
+        return iter(self.__set)
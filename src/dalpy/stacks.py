@@ -53,9 +53,11 @@ class Stack:
             y = s.top()
     """
 
+    __slots__ = ('_buf', '__dict__')
+
     def __init__(self):
         """Initializes an empty `Stack` in `O(1)` time."""
-        self.__buf = deque()
+        self._buf = deque()
 
     def top(self):
         """Gets the element at the top of this `Stack`.
@@ -69,9 +71,10 @@ class Stack:
         Raises:
              StackUnderflowError: If this `Stack` is empty.
         """
-        if len(self.__buf) == 0:
+        buf = self._buf
+        if not buf:
             raise StackUnderflowError('top()')
-        return self.__buf[-1]
+        return buf[-1]
 
     def pop(self):
         """Removes the element at the top of this `Stack`.
@@ -85,9 +88,10 @@ class Stack:
         Raises:
              StackUnderflowError: If this `Stack` is empty.
         """
-        if len(self.__buf) == 0:
+        buf = self._buf
+        if not buf:
             raise StackUnderflowError('pop()')
-        return self.__buf.pop()
+        return buf.pop()
 
     def push(self, value):
         """Adds an element to the top of this `Stack`.
@@ -97,12 +101,20 @@ class Stack:
         Args:
             value: Element to add to this `Stack`. It can be of any type.
         """
-        self.__buf.append(value)
+        self._buf.append(value)
+
+    def _extend(self, values):
+        # library-internal bulk push, used by dalpy.factory_utils
+        self._buf.extend(values)
+
+    def _buffer(self):
+        # library-internal access to the backing deque (not a copy), bottom first
+        return self._buf
 
     def is_empty(self):
         """Returns `True` if this `Stack` is empty, `False` otherwise in `O(1)` time w/r/t the size of this `Stack`."""
-        return len(self.__buf) == 0
+        return not self._buf
 
     def size(self):
         """Returns the integer number of elements in this `Stack` in `O(1)` time w/r/t the size of this `Stack`."""
-        return len(self.__buf)
+        return len(self._buf)
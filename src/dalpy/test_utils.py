@@ -4,15 +4,21 @@ This module contains the `build_and_run_watched_suite`, `assert_array_equals`, `
 `dalpy_equals` and the `dalpy_to_string` functions, as well as `UnexpectedReturnWarning`.
 """
 import copy
-import inspect
+import functools
 import math
+import signal
+import sys
+import threading
 import traceback
 import unittest
+import time
 import warnings
-from multiprocessing import Process
+from collections import deque
+from multiprocessing import get_all_start_methods, get_context, Pipe, Process
+from multiprocessing.connection import wait
+from multiprocessing.reduction import ForkingPickler
 
 from dalpy.arrays import Array, Array2D
-from dalpy.factory_utils import copy_stack
 from dalpy.graphs import Graph, Vertex
 from dalpy.linked_lists import SinglyLinkedListNode
 from dalpy.queues import Queue
@@ -21,7 +27,8 @@ from dalpy.stacks import Stack
 from dalpy.trees import BinaryTreeNode, NaryTreeNode
 
 
-def build_and_run_watched_suite(cases, timeout=None, show_tb=False, grading_file=None, warning_filter="once"):
+def build_and_run_watched_suite(cases, timeout=None, show_tb=False, grading_file=None, warning_filter="once",
+                                processes=1, in_process=False):
     """Runs a set of test cases, ensuring that they do not run longer than `timeout` seconds. Optionally,
     writes comma-separated test results to a file.
 
@@ -32,29 +39,44 @@ def build_and_run_watched_suite(cases, timeout=None, show_tb=False, grading_file
         grading_file: Output file path to store comma-separated test results.
         warning_filter: A `warnings.simplefilter` action. Default value ensures that warnings are only displayed once.
                         Choose `"ignore"` to suppress warnings.
+        processes: Number of tests to run at the same time, each in its own worker process. Default value runs the tests
+                   one at a time. Tests that run at the same time should not depend on each other, e.g. through files.
+        in_process: Boolean toggle to enforce `timeout` with a timer signal in this process instead of running the tests
+                    in worker processes. Only used if `processes` is 1, on systems that support `signal.setitimer` (i.e.
+                    not on Windows), and when called from the main thread.
+
+    If `grading_file` is not specified, the test logs will be dumped to console. If `timeout` or `processes` is
+    specified, the tests are run in separate worker processes, so a test that times out is always stopped by terminating
+    its process. A test whose process exits without reporting back (e.g. because it crashed) is recorded as an error.
+    The workers are reused from test to test and only replaced when a test times out or its worker exits. A test that
+    cannot be pickled to be sent to a worker (e.g. because its `TestCase` is defined inside a function) is run in a
+    process forked for it instead, or, on systems that cannot fork (e.g. Windows), in this process without a timeout.
+    The results are reported in the same order regardless of `processes`.
+
+    With `in_process`, a test that times out is only stopped if it lets the timeout error through. A test that catches
+    it with a bare `except:` (or `except BaseException:`) keeps running, and a test stuck in one long call into C code
+    is not interrupted until that call returns. Anything a stopped test changed, such as module level state, is also
+    left as it is for the tests that run after it. Tests of untrusted code should not use `in_process`.
 
-    If `grading_file` is not specified, the test logs will be dumped to console.
+    Raises:
+        ValueError: If `processes` is not a positive integer (`bool`s are not accepted).
     """
-
-    def _warning(
-            message,
-            category,
-            filename,
-            lineno,
-            file=None,
-            line=None):
-        print(f'{__bcolors.WARNING}{category.__name__}: {message}{__bcolors.ENDC}')
-
-    warnings.showwarning = _warning
-    warnings.simplefilter(warning_filter, UnexpectedReturnWarning)
-    warnings.simplefilter("once", DeprecationWarning)
+    if not isinstance(processes, int) or isinstance(processes, bool) or processes < 1:
+        raise ValueError(f'processes ({processes}) must be an integer >= 1')
+    __configure_warnings(warning_filter)
     watcher = _Watcher(show_tb)
     suite = unittest.TestSuite()
     for case in cases:
         tests = unittest.defaultTestLoader.loadTestsFromTestCase(case)
         suite.addTests(tests)
-    for test in suite:
-        __run_timed_test(test, watcher, timeout)
+    if timeout is None and processes == 1:
+        for test in suite:
+            test.run(watcher)
+    elif in_process and processes == 1 and hasattr(signal, 'setitimer') and \
+            threading.current_thread() is threading.main_thread():
+        __run_alarmed_tests(suite, watcher, timeout)
+    else:
+        __run_pooled_tests(suite, watcher, timeout, warning_filter, processes)
     if grading_file is not None:
         watcher.print_columns(grading_file)
     else:
@@ -108,7 +130,9 @@ def behavior_test(behavior, objects):
     The objects parameter is the object who's behavior is being tested, which will be used for the test log.
     If multiple objects are being tested, pass a tuple of objects.
     """
-    msg = f'Behavior:\ninit {", ".join(type(obj).__name__ for obj in objects) if isinstance(objects, list) else type(objects).__name__}\n'
+    # each step is stringified as soon as it runs, since later steps may modify its result. The steps are only joined
+    # into a message if the test fails
+    steps = list()
     passed = True
     expected, method, params, result = None, None, None, None
     if not isinstance(behavior, list): behavior = [behavior]
@@ -120,24 +144,23 @@ def behavior_test(behavior, objects):
             if len(event) > 2:
                 params = (event[2],)
                 result = method(*params)
-                msg += f'{__method_to_string((method,) + params)} {dalpy_to_string(result)}'
+                steps.append(f'{__method_to_string((method,) + params)} {dalpy_to_string(result)}')
             else:
                 result = method()
-                msg += f'{__method_to_string(method)} {dalpy_to_string(result)}'
+                steps.append(f'{__method_to_string(method)} {dalpy_to_string(result)}')
                 params = None
             if dalpy_equals(result, expected):
-                msg += ' ✓\n'
                 continue
-            msg += f' ✗\nexpected {dalpy_to_string(expected)}'
             passed = False
             break
     except Exception as e:
         # If expected is an exception then check that exception thrown matches expected exception
-        msg += f'{__method_to_string((method,) + params if params is not None else method)} {dalpy_to_string(result)} ✗\n'
         if type(expected) == type and isinstance(e, expected): return
+        steps.append(f'{__method_to_string((method,) + params if params is not None else method)} '
+                     f'{dalpy_to_string(result)}')
         # error_message = e.args[0] if len(e.args) > 0 else e.with_traceback
-        assert False, f'{msg}Unexpected error: {type(e).__name__}'
-    assert passed, msg
+        assert False, f'{__behavior_to_string(objects, steps)} ✗\nUnexpected error: {type(e).__name__}'
+    assert passed, f'{__behavior_to_string(objects, steps)} ✗\nexpected {dalpy_to_string(expected)}'
 
 
 def run_generic_test(params, expected, method, custom_comparator=None, in_place=False, enforce_no_mod=False,
@@ -209,9 +232,15 @@ def generic_test(params, expected, method, custom_comparator=None, in_place=Fals
         AssertionError: If the test fails.
         UnexpectedReturnWarning: If `in_place` is set to `True` but `method` still returns a value.
     """
+    # the input and expected value are stringified before the method runs, since the method may modify them. The
+    # output is only stringified if the test fails
     msg = f"Input: {dalpy_to_string(params) if params_to_string is None else params_to_string(params)}\nExpected: {dalpy_to_string(expected) if expected_to_string is None else expected_to_string(expected)}\n"
-    params_copy = copy.deepcopy(params) if isinstance(params, list) else [copy.deepcopy(params)]
-    passed = True
+
+    params_list = params if isinstance(params, list) else [params]
+    enforce_no_mod = [enforce_no_mod] * len(params_list) if isinstance(enforce_no_mod, bool) else enforce_no_mod
+    # only the parameters that should not be modified need to be copied (by default, none of them)
+    params_copy = [__clone(param) if no_mod else None for param, no_mod in zip(params_list, enforce_no_mod)]
+    failure = None
     try:
         result = method(*params) if isinstance(params, list) else method(params)
         if in_place:
@@ -219,27 +248,22 @@ def generic_test(params, expected, method, custom_comparator=None, in_place=Fals
                 warnings.warn("A function that is meant to modify its argument(s) returned a non-None value.",
                               UnexpectedReturnWarning, stacklevel=2)
             result = params
-        result_string = output_to_string(result) if output_to_string is not None else dalpy_to_string(result)
         if custom_comparator is None:
-            if not dalpy_equals(expected, result):
-                msg = f"{msg}Output: {result_string}"
-                passed = False
-        elif not custom_comparator(expected, result):
-            msg = f"{msg}Output: {result_string}"
-            passed = False
+            passed = dalpy_equals(expected, result)
+        else:
+            passed = custom_comparator(expected, result)
+        if not passed:
+            failure = f"{msg}Output: {output_to_string(result) if output_to_string is not None else dalpy_to_string(result)}"
     except Exception as e:
         # If expected is an exception then check that exception thrown matches expected exception
         if type(expected) == type and isinstance(e, expected): return
         error_message = e.args[0] if len(e.args) > 0 else e.with_traceback
         assert False, f"{msg}Output: {error_message}"
-    assert passed, msg
-    enforce_no_mod = [enforce_no_mod] * len(params_copy) if isinstance(enforce_no_mod, bool) else enforce_no_mod
-    modified_params_string = dalpy_to_string(params) if params_to_string is None else params_to_string(params)
-    if not isinstance(params, list): params = [params]
+    assert failure is None, failure
     for i, no_mod in enumerate(enforce_no_mod):
         if no_mod:
-            assert dalpy_equals(params_copy[i], params[
-                i]), f"{msg}Output: The {str(i + 1) + __append_int(i + 1)} input argument should not have been modified.\nArguments: {modified_params_string}"
+            assert dalpy_equals(params_copy[i], params_list[
+                i]), f"{msg}Output: The {str(i + 1) + __append_int(i + 1)} input argument should not have been modified.\nArguments: {dalpy_to_string(params) if params_to_string is None else params_to_string(params)}"
 
 
 def dalpy_equals(first, second):
@@ -250,7 +274,7 @@ def dalpy_equals(first, second):
     `dalpy.queues.Queue`, `dalpy.stacks.Stack`, `dalpy.sets.Set`,
     `dalpy.linked_lists.SinglyLinkedListNode`. For `dalpy.linked_lists.SinglyLinkedListNode`, checks that all
     nodes next of the passed `dalpy.linked_lists.SinglyLinkedListNode`s are the same. For instances of `float`s,
-    `math.isclose` is used for comparison.
+    `math.isclose` is used for comparison. An object is always equal to itself.
 
     Args:
         first: The first element to be tested.
@@ -259,20 +283,11 @@ def dalpy_equals(first, second):
     Returns:
         `True` if `first = second` otherwise `False`.
     """
-    if isinstance(first, Array) and isinstance(second, Array):
-        return __array_equals(first, second)
-    if isinstance(first, Array2D) and isinstance(second, Array2D):
-        return __array2d_equals(first, second)
-    if isinstance(first, Queue) and isinstance(second, Queue):
-        return __queue_equals(first, second)
-    if isinstance(first, Stack) and isinstance(second, Stack):
-        return __stack_equals(first, second)
-    if isinstance(first, Set) and isinstance(second, Set):
-        return __set_equals(first, second)
-    if isinstance(first, SinglyLinkedListNode) and isinstance(second, SinglyLinkedListNode):
-        return __singly_linked_list_equals(first, second)
-    if isinstance(first, float) and isinstance(second, float):
-        return math.isclose(first, second)
+    if first is second:
+        return True
+    kind, equals = __EQUALS.get(type(first)) or __resolve_handler(__EQUALS, type(first), (object, None))
+    if equals is not None and isinstance(second, kind):
+        return equals(first, second)
     return first == second
 
 
@@ -295,32 +310,14 @@ def dalpy_to_string(obj):
     Args:
         obj: The object to convert to string
     """
-    if isinstance(obj, list):
-        return "[" + ", ".join(dalpy_to_string(elem) for elem in obj) + "]"
-    if isinstance(obj, Array):
-        return "Array" + __array_to_string(obj)
-    if isinstance(obj, Array2D):
-        return "Array2D" + __array2d_to_string(obj)
-    if isinstance(obj, Queue):
-        return "Queue" + __queue_to_string(obj)
-    if isinstance(obj, Stack):
-        return "Stack" + __stack_to_string(obj)
-    if isinstance(obj, Set):
-        return "Set" + __set_to_string(obj)
-    if isinstance(obj, SinglyLinkedListNode):
-        return __singly_linked_list_to_string(obj)
-    if isinstance(obj, BinaryTreeNode):
-        return "BinaryTree" + __binary_tree_to_string(obj)
-    if isinstance(obj, NaryTreeNode):
-        return "NaryTree" + __nary_tree_to_string(obj)
-    if isinstance(obj, Vertex):
-        return __vertex_to_string(obj)
-    if isinstance(obj, Graph):
-        return __graph_to_string(obj)
-    try:
+    t = type(obj)
+    # most elements of the containers being stringified are plain scalars, so they skip the table lookup
+    if t is int:
+        return __SMALL_INT_STRINGS[obj] if 0 <= obj < 1024 else str(obj)
+    if t is str or t is float or t is bool:
         return str(obj)
-    except:
-        return obj
+    prefix, to_string = __TO_STRING.get(t) or __resolve_handler(__TO_STRING, t, ('', __object_to_string))
+    return prefix + to_string(obj)
 
 
 class UnexpectedReturnWarning(Warning):
@@ -328,17 +325,24 @@ class UnexpectedReturnWarning(Warning):
     pass
 
 
-class _TestTimeoutError(Exception):
+# not an Exception so that a test that times out in an except Exception block (e.g. in generic_test) is still stopped
+class _TestTimeoutError(BaseException):
     def __init__(self, timeout):
         super().__init__(f'Test timed out after {timeout}s.')
 
 
+class _TestCrashedError(Exception):
+    def __init__(self, exitcode):
+        super().__init__(f'Test process exited unexpectedly (exit code {exitcode}).')
+
+
 class _Watcher(unittest.TestResult):
 
     def __init__(self, show_tb):
         super().__init__()
         self.test_ids = list()
-        self.results = list()
+        # one b'1' (passed) or b'0' (failed) per test, in the same order as test_ids
+        self.results = bytearray()
         self.details = list()
         self.show_tb = show_tb
 
@@ -349,37 +353,50 @@ class _Watcher(unittest.TestResult):
     @staticmethod
     def get_description(test):
         if test.shortDescription() is None: return '\n'
-        lines = test._testMethodDoc.split('\n')
-        return "\n".join(line.strip() for line in lines) + "Output:\t"
+        return _Watcher.parse_doc(test._testMethodDoc)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def parse_doc(doc):
+        # cached since the same docstring is parsed again whenever its test fails again, e.g. when it is re-run
+        return "\n".join(line.strip() for line in doc.split('\n')) + "Output:\t"
 
     def addSuccess(self, test) -> None:
         self.test_ids.append(_Watcher.parse_id(test.id()))
-        self.results.append(1)
+        self.results += b'1'
 
     def addFailure(self, test, err) -> None:
-        self.test_ids.append(_Watcher.parse_id(test.id()))
-        self.results.append(0)
+        test_id = _Watcher.parse_id(test.id())
+        self.test_ids.append(test_id)
+        self.results += b'0'
         tb_str = ''
         if self.show_tb:
             tb_str = '\n' + ''.join(traceback.format_tb(err[2]))
-        self.details.append((_Watcher.get_description(test), str(err[1]) + tb_str, _Watcher.parse_id(test.id())))
+        self.details.append((_Watcher.get_description(test), str(err[1]) + tb_str, test_id))
 
     def addError(self, test, err):
-        self.test_ids.append(_Watcher.parse_id(test.id()))
-        self.results.append(0)
+        test_id = _Watcher.parse_id(test.id())
+        self.test_ids.append(test_id)
+        self.results += b'0'
         tb_str = ''
         if self.show_tb:
             tb_str = '\n' + ''.join(traceback.format_tb(err[2]))
-        self.details.append(
-            (_Watcher.get_description(test), err[0], str(err[1]) + tb_str, _Watcher.parse_id(test.id())))
+        self.details.append((_Watcher.get_description(test), err[0], str(err[1]) + tb_str, test_id))
+
+    def outcome(self):
+        return self.test_ids, self.results, self.details
+
+    def merge(self, outcome):
+        test_ids, results, details = outcome
+        self.test_ids.extend(test_ids)
+        self.results += results
+        self.details.extend(details)
 
     # Note The order in which the various tests will be run is determined by sorting the test method names with respect
     # to the built-in ordering for strings.
     def print_columns(self, fp):
         with open(fp, mode='w+', encoding='utf-8') as f:
-            f.write(",".join(self.test_ids))
-            f.write('\n')
-            f.write(",".join(str(e) for e in self.results))
+            f.write(",".join(self.test_ids) + "\n" + ",".join(self.results.decode()))
 
     def print_log(self):
         log = list()
@@ -389,57 +406,250 @@ class _Watcher(unittest.TestResult):
             else:
                 log.append(f'{detail[0]} raised {detail[1]}.\nMessage: {detail[2]}')
         print("\n" + ("\n" + "-" * 40 + "\n").join(
-            log) + f"\n{'=' * 40}\n{sum(self.results)}/{len(self.results)} tests passed.\n")
+            log) + f"\n{'=' * 40}\n{self.results.count(b'1')}/{len(self.results)} tests passed.\n")
+
+
+def __configure_warnings(warning_filter):
+    warnings.showwarning = __show_warning
+    warnings.simplefilter(warning_filter, UnexpectedReturnWarning)
+    warnings.simplefilter("once", DeprecationWarning)
+
+
+def __show_warning(message, category, filename, lineno, file=None, line=None):
+    print(f'{__bcolors.WARNING}{category.__name__}: {message}{__bcolors.ENDC}')
+
+
+def __run_alarmed_tests(tests, watcher, timeout):
+    # a timer raises _TestTimeoutError in the running test if it takes too long, which the test records as an error
+    def _raise_timeout(signum, frame):
+        raise _TestTimeoutError(timeout)
+
+    handler = signal.signal(signal.SIGALRM, _raise_timeout)
+    try:
+        for test in tests:
+            recorded = len(watcher.results)
+            signal.setitimer(signal.ITIMER_REAL, timeout)
+            try:
+                try:
+                    test.run(watcher)
+                finally:
+                    signal.setitimer(signal.ITIMER_REAL, 0)
+            except _TestTimeoutError as e:
+                # the timer went off while the test was not running one of the parts it records errors for, e.g. as it
+                # was finishing
+                if len(watcher.results) == recorded:
+                    watcher.addError(test, (_TestTimeoutError, e, e.__traceback__))
+    finally:
+        signal.signal(signal.SIGALRM, handler)
+
+
+def __run_pooled_tests(tests, watcher, timeout, warning_filter, processes):
+    # each test is run exactly once, in a worker process, which sends back what it recorded. A worker runs one test at a
+    # time, so a test that times out, or whose worker exits without reporting back (e.g. it crashed), is known and only
+    # its worker is replaced. What the tests recorded is merged in suite order
+    tests = list(tests)
+    outcomes = [None] * len(tests)
+    waiting = deque(range(len(tests)))
+    idle = list()
+    # the connection to each busy worker -> (worker, index of its test, deadline)
+    running = dict()
+    # the connections to workers forked to run a single test
+    forked = set()
+    try:
+        while waiting or running:
+            while waiting and len(running) < processes:
+                i = waiting.popleft()
+                deadline = math.inf if timeout is None else time.monotonic() + timeout
+                try:
+                    test = ForkingPickler.dumps(tests[i])
+                except Exception:
+                    # the test cannot be sent to a worker, e.g. because its TestCase is defined in a function
+                    if 'fork' in get_all_start_methods():
+                        worker, conn = __fork_test(tests[i], watcher.show_tb)
+                        forked.add(conn)
+                        running[conn] = (worker, i, deadline)
+                    else:
+                        outcomes[i] = (__run_watched_test(tests[i], watcher.show_tb), None)
+                    continue
+                worker, conn = idle.pop() if idle else __start_worker(warning_filter, watcher.show_tb)
+                try:
+                    conn.send_bytes(test)
+                except OSError:
+                    # the idle worker has exited since it last reported back
+                    conn.close()
+                    worker, conn = __start_worker(warning_filter, watcher.show_tb)
+                    conn.send_bytes(test)
+                running[conn] = (worker, i, deadline)
+            remaining = min(deadline for _, _, deadline in running.values()) - time.monotonic()
+            sentinels = {worker.sentinel: conn for conn, (worker, _, _) in running.items()}
+            ready = wait(list(running) + list(sentinels), None if remaining == math.inf else max(remaining, 0))
+            for conn in {sentinels.get(r, r) for r in ready}:
+                worker, i, _ = running.pop(conn)
+                try:
+                    outcomes[i] = (conn.recv(), None)
+                    if conn in forked:
+                        worker.join()
+                        conn.close()
+                    else:
+                        idle.append((worker, conn))
+                except (EOFError, OSError):
+                    worker.join()
+                    conn.close()
+                    outcomes[i] = (None, (_TestCrashedError, _TestCrashedError(worker.exitcode), None))
+            now = time.monotonic()
+            for conn, (worker, i, deadline) in list(running.items()):
+                if deadline <= now:
+                    # a test that is still running cannot be stopped without terminating its worker
+                    del running[conn]
+                    worker.terminate()
+                    conn.close()
+                    outcomes[i] = (None, (_TestTimeoutError, _TestTimeoutError(timeout), None))
+    finally:
+        for worker, conn in idle + [(worker, conn) for conn, (worker, _, _) in running.items()]:
+            worker.terminate()
+            conn.close()
+    for test, (outcome, err) in zip(tests, outcomes):
+        if err is None:
+            watcher.merge(outcome)
+        else:
+            watcher.addError(test, err)
+
+
+def __start_worker(warning_filter, show_tb):
+    conn, worker_conn = Pipe()
+    worker = Process(target=__watch_tests, args=(worker_conn, warning_filter, show_tb), daemon=True)
+    worker.start()
+    # only the worker holds the other end from now on, so the connection reports EOF once the worker exits
+    worker_conn.close()
+    return worker, conn
+
+
+def __fork_test(test, show_tb):
+    # a forked process starts with a copy of this one, so the test does not have to be pickled to be sent to it
+    conn, worker_conn = Pipe()
+    worker = get_context('fork').Process(target=__report_test, args=(worker_conn, test, show_tb), daemon=True)
+    worker.start()
+    worker_conn.close()
+    return worker, conn
+
+
+def __watch_tests(conn, warning_filter, show_tb):
+    # runs in a worker process, until it is terminated
+    __configure_warnings(warning_filter)
+    while True:
+        __report_test(conn, conn.recv(), show_tb)
+
+
+def __report_test(conn, test, show_tb):
+    test_ids, results, details = __run_watched_test(test, show_tb)
+    # error types are sent as the strings they are displayed as, since the test may define them where they cannot be
+    # pickled
+    details = [tuple(str(d) if isinstance(d, type) else d for d in detail) for detail in details]
+    conn.send((test_ids, results, details))
+
+
+def __run_watched_test(test, show_tb):
+    watcher = _Watcher(show_tb)
+    try:
+        test.run(watcher)
+    finally:
+        # the worker may be terminated before it exits, so anything the test printed is flushed now
+        sys.stdout.flush()
+        sys.stderr.flush()
+    return watcher.outcome()
+
+
+def __clone(obj):
+    # a deep copy of obj that copies DALPy containers directly instead of going through copy.deepcopy, which is only
+    # used for types not handled here
+    cloner = __CLONERS.get(type(obj))
+    return copy.deepcopy(obj) if cloner is None else cloner(obj)
+
+
+def __clone_array(array):
+    return Array._from_list([__clone(elem) for elem in array._buffer()])
 
 
-def __run_timed_test(test, watcher, timeout):
-    if timeout is not None:
-        p = Process(target=test.run)
-        p.start()
-        p.join(timeout=timeout)
-        if p.is_alive():
-            p.terminate()
-            watcher.addError(test, (_TestTimeoutError, _TestTimeoutError(timeout)))
-            return
-    test.run(watcher)
+def __clone_array2d(array):
+    cpy = Array2D(array.rows(), array.columns())
+    cpy._buffer()[:] = [__clone(elem) for elem in array._buffer()]
+    return cpy
+
+
+def __clone_queue(queue):
+    cpy = Queue()
+    cpy._extend(__clone(elem) for elem in queue._buffer())
+    return cpy
+
+
+def __clone_stack(stack):
+    cpy = Stack()
+    cpy._extend(__clone(elem) for elem in stack._buffer())
+    return cpy
+
+
+def __clone_set(s):
+    return Set.from_iterable(__clone(elem) for elem in s)
+
+
+def __clone_list(ls):
+    return [__clone(elem) for elem in ls]
+
+
+def __clone_tuple(t):
+    return tuple(__clone(elem) for elem in t)
+
+
+def __clone_immutable(obj):
+    return obj
+
+
+__CLONERS = {
+    Array: __clone_array,
+    Array2D: __clone_array2d,
+    Queue: __clone_queue,
+    Stack: __clone_stack,
+    Set: __clone_set,
+    list: __clone_list,
+    tuple: __clone_tuple,
+    int: __clone_immutable,
+    float: __clone_immutable,
+    bool: __clone_immutable,
+    str: __clone_immutable,
+    type(None): __clone_immutable,
+}
+
+
+def __list_to_string(ls):
+    return "[" + ", ".join(dalpy_to_string(elem) for elem in ls) + "]"
+
+
+def __object_to_string(obj):
+    try:
+        return str(obj)
+    except:
+        return obj
 
 
 def __array_to_string(array):
-    out = "["
-    for i in range(array.length()):
-        out += f'{dalpy_to_string(array[i])}, '
-    return out[:-2] + "]" if array.length() > 0 else out + "]"
+    return "[" + ", ".join(dalpy_to_string(elem) for elem in array._buffer()) + "]"
 
 
 def __array2d_to_string(array):
-    out = "["
-    for i in range(array.rows()):
-        out += "["
-        for j in range(array.columns()):
-            out += f'{dalpy_to_string(array[(i, j)])}, '
-        out = out[:-2] + "]\n "
-    return out[:-2] + "]"
+    buf, columns = array._buffer(), array.columns()
+    rows = ("[" + ", ".join(dalpy_to_string(elem) for elem in buf[i:i + columns]) + "]"
+            for i in range(0, len(buf), columns))
+    return "[" + "\n ".join(rows) + "]"
 
 
 def __queue_to_string(queue):
-    out = []
-    for _ in range(queue.size()):
-        next = queue.dequeue()
-        out.append(dalpy_to_string(next))
-        queue.enqueue(next)
-    return "[" + ", ".join(out) + "]"
+    # reads the backing deque front to back instead of dequeueing and re-enqueueing every element
+    return "[" + ", ".join(dalpy_to_string(elem) for elem in queue._buffer()) + "]"
 
 
 def __stack_to_string(stack):
-    out = []
-    temp_stack = Stack()
-    for _ in range(stack.size()):
-        next = stack.pop()
-        out.insert(0, dalpy_to_string(next))
-        temp_stack.push(next)
-    while not temp_stack.is_empty():
-        stack.push(temp_stack.pop())
-    return "[" + ", ".join(out) + "]"
+    # reads the backing deque bottom to top instead of popping every element and pushing it back
+    return "[" + ", ".join(dalpy_to_string(elem) for elem in stack._buffer()) + "]"
 
 
 def __set_to_string(s):
@@ -451,12 +661,14 @@ def __set_to_string(s):
 
 def __singly_linked_list_to_string(head):
     out = list()
+    # nodes are tracked by id() so that cycle detection never calls a (possibly overridden) __hash__ or __eq__. The
+    # nodes stay reachable from head while this runs, so their ids cannot be reused
     seen = set()
     while head is not None:
-        if head in seen:
+        if id(head) in seen:
             out.append("cycle")
             break
-        seen.add(head)
+        seen.add(id(head))
         out.append(dalpy_to_string(head.data))
         head = head.next
     return "➔ ".join(out)
@@ -473,14 +685,14 @@ def __binary_tree_to_string(root):
         return ""
 
     out_buf = list()
-    q = list()
+    q = deque()
     q.append(root)
     all_none_level = False
     while not all_none_level:
         k = len(q)
         all_none_level = True
         for _ in range(k):
-            curr = q.pop(0)
+            curr = q.popleft()
             if curr is not None:
                 q.append(curr.left)
                 q.append(curr.right)
@@ -499,17 +711,11 @@ def __vertex_to_string(vertex):
 def __graph_to_string(graph):
     contents = list()
     for vertex in graph.vertices():
-        edges = list()
-        for dest in graph.adj(vertex):
-            edge_str = f'{dest.get_name()}'
-            weight = graph.weight(vertex, dest)
-            if weight is not None:
-                edge_str += f' <{weight}>'
-            edges.append(edge_str)
-        edges = ', '.join(edges)
+        # adj_with_weights gives each weight along with its destination, instead of a weight() lookup per edge
+        edges = ', '.join(f'{dest.get_name()}' if weight is None else f'{dest.get_name()} <{weight}>'
+                          for dest, weight in graph.adj_with_weights(vertex))
         contents.append(f'{vertex.get_name()}: {edges}')
-    contents = '\n'.join(contents)
-    return contents
+    return '\n'.join(contents)
 
 
 def __nary_tree_to_string(root):
@@ -517,11 +723,11 @@ def __nary_tree_to_string(root):
     if root is None:
         return ""
     out = list()
-    q = [root, root.right_sibling]
+    q = deque([root, root.right_sibling])
     while len(q) > 0:
         k = len(q)
         for _ in range(k):
-            curr = q.pop(0)
+            curr = q.popleft()
             if curr is None:
                 out.append(None)
             else:
@@ -536,40 +742,26 @@ def __nary_tree_to_string(root):
 
 
 def __array_equals(expected, actual):
-    if expected.length() != actual.length(): return False
-    for i in range(expected.length()):
-        if expected[i] != actual[i]: return False
-    return True
+    # list equality compares the elements in C, treating identical elements as equal before trying ==
+    return expected._buffer() == actual._buffer()
 
 
 def __array2d_equals(expected, actual):
     if expected.rows() != actual.rows() or expected.columns() != actual.columns(): return False
-    for i in range(expected.rows()):
-        for j in range(expected.columns()):
-            if expected[i, j] != actual[i, j]: return False
-    return True
+    return expected._buffer() == actual._buffer()
 
 
 def __queue_equals(expected, actual):
-    for _ in range(expected.size()):
-        expected_elem = expected.dequeue()
-        actual_elem = actual.dequeue()
-        if expected_elem != actual_elem: return False
-        expected.enqueue(expected_elem)
-        actual.enqueue(actual_elem)
-    return expected.size() == actual.size()
+    if expected.size() != actual.size(): return False
+    for e, a in zip(expected._buffer(), actual._buffer()):
+        if e != a: return False
+    return True
 
 
 def __stack_equals(expected, actual):
     if expected.size() != actual.size(): return False
-    expected_cpy = copy_stack(expected)
-    actual_cpy = copy_stack(actual)
-    i = 0
-    while not expected_cpy.is_empty():
-        e = expected_cpy.pop()
-        a = actual_cpy.pop()
+    for e, a in zip(expected._buffer(), actual._buffer()):
         if e != a: return False
-        i += 1
     return True
 
 
@@ -586,19 +778,67 @@ def __set_equals(expected, actual):
 def __singly_linked_list_equals(expected, actual):
     seen = set()
     while (expected is not None and actual is not None):
-        if actual in seen: return False
-        seen.add(actual)
+        if id(actual) in seen: return False
+        seen.add(id(actual))
         if expected != actual: return False
         expected = expected.next
         actual = actual.next
     return expected is None and actual is None
 
 
+# test data is mostly made up of small non-negative ints, so their strings are made once instead of on every call
+__SMALL_INT_STRINGS = tuple(str(i) for i in range(1024))
+
+# dalpy_to_string and dalpy_equals look up how to handle an object by its exact type in these tables. The entries are
+# checked in order, so a type is handled like the first of these types it derives from
+
+__TO_STRING = {
+    list: ('', __list_to_string),
+    Array: ('Array', __array_to_string),
+    Array2D: ('Array2D', __array2d_to_string),
+    Queue: ('Queue', __queue_to_string),
+    Stack: ('Stack', __stack_to_string),
+    Set: ('Set', __set_to_string),
+    SinglyLinkedListNode: ('', __singly_linked_list_to_string),
+    BinaryTreeNode: ('BinaryTree', __binary_tree_to_string),
+    NaryTreeNode: ('NaryTree', __nary_tree_to_string),
+    Vertex: ('', __vertex_to_string),
+    Graph: ('', __graph_to_string),
+}
+
+__EQUALS = {
+    Array: (Array, __array_equals),
+    Array2D: (Array2D, __array2d_equals),
+    Queue: (Queue, __queue_equals),
+    Stack: (Stack, __stack_equals),
+    Set: (Set, __set_equals),
+    SinglyLinkedListNode: (SinglyLinkedListNode, __singly_linked_list_equals),
+    float: (float, math.isclose),
+}
+
+
+def __resolve_handler(table, t, default):
+    # finds the entry for a type that is not in the table yet, e.g. a subclass or a non-DALPy type, and adds it so that
+    # later objects of the type are looked up directly
+    for cls, entry in list(table.items()):
+        if issubclass(t, cls):
+            break
+    else:
+        entry = default
+    table[t] = entry
+    return entry
+
+
+def __behavior_to_string(objects, steps):
+    # every step but the last passed, the caller appends how the last one failed
+    return (f'Behavior:\ninit {", ".join(type(obj).__name__ for obj in objects) if isinstance(objects, list) else type(objects).__name__}\n'
+            + ' ✓\n'.join(steps))
+
+
 def __method_to_string(method):
-    new_line = "\n"
     if isinstance(method, tuple):
-        return f'({str(inspect.getsourcelines(method[0])[0][0]).strip(new_line).strip().split()[1].replace("(self,", "")}, {", ".join(str(param) for param in method[1:])})'
-    return str(inspect.getsourcelines(method)[0][0]).strip("\n").strip().split()[1].replace('(self):', '()')
+        return f'({getattr(method[0], "__name__", method[0])}, {", ".join(str(param) for param in method[1:])})'
+    return f'{getattr(method, "__name__", method)}()'
 
 
 def __append_int(num):
@@ -22,6 +22,40 @@ class CopyStackTest(unittest.TestCase):
         generic_test(s, expected, copy_stack, enforce_no_mod=True)
 
 
+class MakeQueueStackTest(unittest.TestCase):
+
+    def test_make_queue(self):
+        q = make_queue([1, 2, 3])
+        self.assertEqual(q.size(), 3)
+        for i in range(3):
+            self.assertEqual(q.dequeue(), i + 1)
+
+    def test_make_stack(self):
+        s = make_stack([1, 2, 3])
+        self.assertEqual(s.size(), 3)
+        for i in range(3):
+            self.assertEqual(s.pop(), 3 - i)
+
+
+class MakeArrayTest(unittest.TestCase):
+
+    def test_make_array(self):
+        a = make_array([1, 2, 3])
+        self.assertEqual(a.length(), 3)
+        for i in range(3):
+            self.assertEqual(a[i], i + 1)
+
+    def test_make_empty_array(self):
+        a = make_array([])
+        self.assertEqual(a.length(), 0)
+
+    def test_make_array_copies(self):
+        ls = [1, 2]
+        a = make_array(ls)
+        ls[0] = 3
+        self.assertEqual(a[0], 1)
+
+
 class AddChildrenTest(unittest.TestCase):
     def test_add_no_children(self):
         root = NaryTreeNode('a')
@@ -67,4 +101,4 @@ class AddChildrenTest(unittest.TestCase):
 
 
 if __name__ == '__main__':
-    build_and_run_watched_suite([CopyStackTest, AddChildrenTest])
+    build_and_run_watched_suite([CopyStackTest, MakeQueueStackTest, MakeArrayTest, AddChildrenTest])
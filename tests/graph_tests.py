@@ -25,6 +25,20 @@ class VertexTest(unittest.TestCase):
         v = Vertex('a')
         self.assertRaises(VertexAttributeError, lambda: v['color'])
 
+    def test_invalid_attribute_message(self):
+        v = Vertex('a', color='red', time=1)
+        with self.assertRaises(VertexAttributeError) as cm:
+            v['colour']
+        message = 'vertex a does not have attribute colour, available attributes: [color, time]'
+        self.assertEqual(str(cm.exception), message)
+        self.assertEqual(cm.exception.args[0], message)
+
+    def test_plain_attribute(self):
+        v = Vertex('a')
+        v.seen = True
+        self.assertTrue(v.seen)
+        self.assertEqual(v, Vertex('a'))
+
     def test_invalid_attribute_type(self):
         v = Vertex('a')
 
@@ -47,6 +61,12 @@ class GraphTest(unittest.TestCase):
         self.assertIsInstance(v, Set)
         self.assertTrue(v.is_empty())
 
+    def test_plain_attribute(self):
+        g = Graph()
+        g.time = 0
+        g.time += 1
+        self.assertEqual(g.time, 1)
+
     def test_add_vertex(self):
         g = Graph()
         a = Vertex('a')
@@ -122,6 +142,70 @@ class GraphTest(unittest.TestCase):
         self.assertTrue(b in v)
         self.assertTrue(c in v)
 
+    def test_adj_order(self):
+        g = Graph()
+        a = Vertex('a')
+        b = Vertex('b')
+        c = Vertex('c')
+        g.add_vertex(a)
+        g.add_vertex(b)
+        g.add_vertex(c)
+        g.add_edge(a, b)
+        g.add_edge(a, c)
+        self.assertEqual(list(g.adj(a)), [b, c])
+
+    def test_update_weight(self):
+        g = Graph()
+        a = Vertex('a')
+        b = Vertex('b')
+        g.add_vertex(a)
+        g.add_vertex(b)
+        g.add_edge(a, b, 1)
+        g.add_edge(a, b, 2)
+        self.assertEqual(g.weight(a, b), 2)
+        self.assertEqual(g.adj(a).size(), 1)
+
+    def test_neighbors(self):
+        g = Graph()
+        a = Vertex('a')
+        b = Vertex('b')
+        c = Vertex('c')
+        g.add_vertex(a)
+        g.add_vertex(b)
+        g.add_vertex(c)
+        g.add_edge(a, b)
+        g.add_edge(a, c)
+        self.assertEqual(list(g.neighbors(a)), [b, c])
+        self.assertEqual(list(g.neighbors(b)), [])
+        self.assertRaises(GraphVertexError, lambda: g.neighbors(Vertex('d')))
+
+    def test_adj_with_weights(self):
+        g = Graph()
+        a = Vertex('a')
+        b = Vertex('b')
+        c = Vertex('c')
+        g.add_vertex(a)
+        g.add_vertex(b)
+        g.add_vertex(c)
+        g.add_edge(a, b, 2)
+        g.add_edge(a, c)
+        self.assertEqual(g.adj_with_weights(a), [(b, 2), (c, None)])
+        self.assertEqual(g.adj_with_weights(b), [])
+        self.assertRaises(GraphVertexError, lambda: g.adj_with_weights(Vertex('d')))
+
+    def test_from_edges(self):
+        a = Vertex('a')
+        b = Vertex('b')
+        c = Vertex('c')
+        g = Graph.from_edges([a, b, c], [(a, b, 1), (a, c), (b, c, 2)])
+        self.assertEqual(list(g.vertices()), [a, b, c])
+        self.assertEqual(list(g.adj(a)), [b, c])
+        self.assertEqual(g.weight(a, b), 1)
+        self.assertIsNone(g.weight(a, c))
+        self.assertEqual(g.weight(b, c), 2)
+        self.assertTrue(g.adj(c).is_empty())
+        self.assertRaises(GraphVertexError, lambda: Graph.from_edges([a], [(a, b)]))
+
     def test_unweighted_edge(self):
         g = Graph()
         a = Vertex('a')
@@ -126,6 +126,48 @@ class PriorityQueueTest(unittest.TestCase):
         q.insert('games', 1)
         self.assertRaises(ValueError, lambda: q.insert('games', 1))
 
+    def test_from_iterable(self):
+        activities = ['games', 'test', 'hw', 'quiz']
+        priorities = [4, 1, 3, 2]
+        q = PriorityQueue.from_iterable(zip(activities, priorities))
+        self.assertEqual(q.size(), 4)
+        q.decrease_key('games', 0)
+        for a in ['games', 'test', 'quiz', 'hw']:
+            self.assertEqual(q.extract_min(), a)
+        self.assertTrue(q.is_empty())
+        self.assertRaises(ValueError, lambda: PriorityQueue.from_iterable([('hw', 1), ('hw', 2)]))
+
+    def test_insert_many(self):
+        q = PriorityQueue()
+        q.insert('games', 4)
+        q.insert_many([('test', 1), ('hw', 3), ('quiz', 2)])
+        self.assertEqual(q.size(), 4)
+        q.decrease_key('hw', 0)
+        for a in ['hw', 'test', 'quiz', 'games']:
+            self.assertEqual(q.extract_min(), a)
+        q.insert('games', 4)
+        self.assertRaises(ValueError, lambda: q.insert_many([('test', 1), ('games', 2)]))
+        self.assertEqual(q.size(), 1)
+
+    def test_insert_many_into_large(self):
+        q = PriorityQueue.from_iterable((i, 2 * i) for i in range(100))
+        q.insert_many([('a', 51), ('b', -1)])
+        self.assertEqual(q.size(), 102)
+        q.decrease_key('a', 1)
+        for a in ['b', 0, 'a', 1, 2]:
+            self.assertEqual(q.extract_min(), a)
+
+    def test_meld(self):
+        q = PriorityQueue.from_iterable([('games', 4), ('hw', 3)])
+        r = PriorityQueue.from_iterable([('test', 1), ('quiz', 2)])
+        q.meld(r)
+        self.assertEqual(q.size(), 4)
+        self.assertEqual(r.size(), 2)
+        for a in ['test', 'quiz', 'hw', 'games']:
+            self.assertEqual(q.extract_min(), a)
+        self.assertRaises(ValueError, lambda: r.meld(PriorityQueue.from_iterable([('test', 5)])))
+        self.assertEqual(r.size(), 2)
+
 
 class BuildMinHeapTest(unittest.TestCase):
     def test_build_min_heap(self):
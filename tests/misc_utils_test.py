@@ -1,3 +1,4 @@
+import sys
 import unittest
 from dalpy.misc_utils import *
 
@@ -6,14 +7,16 @@ class MiscTest(unittest.TestCase):
     def test_infintiy(self):
         self.assertGreater(INF, 0)
         self.assertGreater(INF, NEG_INF)
-        self.assertGreater(INF, INF-1)
+        self.assertGreater(INF, sys.maxsize)
         self.assertEqual(INF, INF)
+        self.assertEqual(INF + 1, INF)
     
     def test_neg_infinity(self):
         self.assertLess(NEG_INF, 0)
-        self.assertLess(NEG_INF, NEG_INF+1)
+        self.assertLess(NEG_INF, -sys.maxsize)
         self.assertLess(NEG_INF, INF)
         self.assertEqual(NEG_INF, NEG_INF)
+        self.assertEqual(NEG_INF - 1, NEG_INF)
 
     def test_ceil(self):
         self.assertEqual(ceil(10.5), 11)
@@ -13,7 +13,13 @@ class SetTest(unittest.TestCase):
         self.assertTrue(1 in s)
         s = Set(1, 2, 3, 4)
         self.assertEqual(s.size(), 4)
-        self.assertTrue(all(i in s for i in range(1, 5)))
+        self.assertEqual(set(s), {1, 2, 3, 4})
+
+    def test_from_iterable(self):
+        s = Set.from_iterable(['c', 'a', 'b', 'a'])
+        self.assertEqual(s.size(), 3)
+        self.assertEqual(list(s), ['c', 'a', 'b'])
+        self.assertTrue(Set.from_iterable([]).is_empty())
 
     def test_union(self):
         s = Set()
@@ -34,27 +40,21 @@ class SetTest(unittest.TestCase):
         s.union(Set('a'))
         s.union(Set('b'))
         s.union(Set('c'))
-        self.assertTrue('a' in s)
-        self.assertTrue('b' in s)
-        self.assertTrue('c' in s)
         self.assertEqual(s.size(), 3)
+        self.assertEqual(set(s), {'a', 'b', 'c'})
 
     def test_big_union(self):
         s = Set()
         s.union(Set('a', 'b', 'c'))
-        self.assertTrue('a' in s)
-        self.assertTrue('b' in s)
-        self.assertTrue('c' in s)
         self.assertEqual(s.size(), 3)
+        self.assertEqual(set(s), {'a', 'b', 'c'})
 
     def test_iter(self):
         s = Set('a', 'b', 'c')
         set_elements = set()
         for e in s:
             set_elements.add(e)
-        self.assertTrue('a' in set_elements)
-        self.assertTrue('b' in set_elements)
-        self.assertTrue('c' in set_elements)
+        self.assertEqual(set_elements, {'a', 'b', 'c'})
 
     def test_difference(self):
         s = Set('a', 'b', 'c')
@@ -66,6 +66,25 @@ class SetTest(unittest.TestCase):
         self.assertEqual(s2.size(), 1)
         self.assertTrue('b' in s2)
 
+    def test_difference_larger_other(self):
+        s = Set('a', 'b', 'c')
+        s.difference(Set('d', 'b', 'e', 'a', 'f'))
+        self.assertEqual(list(s), ['c'])
+        s = Set('c', 'a', 'b')
+        s.difference(Set('x', 'y', 'z', 'a'))
+        self.assertEqual(list(s), ['c', 'b'])
+        s.difference(s)
+        self.assertTrue(s.is_empty())
+
+    def test_difference_empty(self):
+        s = Set('a', 'b')
+        s.difference(Set())
+        self.assertEqual(list(s), ['a', 'b'])
+        s = Set()
+        s.difference(Set('a'))
+        self.assertTrue(s.is_empty())
+        self.assertRaises(TypeError, lambda: s.difference('a'))
+
     def test_invalid_difference(self):
         s = Set('a', 'b', 'c')
         self.assertRaises(TypeError, lambda: s.difference('b'))
@@ -88,8 +107,7 @@ class SetTest(unittest.TestCase):
         for c in correct:
             s.union(Set(c))
         for _ in range(100):
-            for i, e in enumerate(s):
-                self.assertEqual(correct[i], e)
+            self.assertEqual(list(s), correct)
 
     def test_remove(self):
         s = Set('a', 'b', 'c')
@@ -98,6 +116,16 @@ class SetTest(unittest.TestCase):
         s.difference(Set('a'))
         self.assertTrue('b' in s and 'c' in s)
 
+    def test_discard(self):
+        s = Set('a', 'b', 'c')
+        s.discard('b')
+        self.assertEqual(list(s), ['a', 'c'])
+        s.discard('b')
+        self.assertEqual(s.size(), 2)
+        s.discard('a')
+        s.discard('c')
+        self.assertTrue(s.is_empty())
+
     def test_add_none(self):
         s = Set(None)
         self.assertTrue(None in s)
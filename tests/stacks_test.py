@@ -29,13 +29,14 @@ class StackTest(unittest.TestCase):
 
     def test_many_push(self):
         s = Stack()
+        tops = []
         for i in range(3):
             s.push(i)
-            self.assertEqual(s.top(), i)
-        for i in range(3):
-            self.assertEqual(s.top(), 3 - i - 1)
-            self.assertEqual(s.pop(), 3 - i - 1)
-            self.assertEqual(s.size(), 3 - i - 1)
+            tops.append(s.top())
+        self.assertEqual(tops, [0, 1, 2])
+        # (top, popped element, size after the pop) for each pop
+        pops = [(s.top(), s.pop(), s.size()) for _ in range(3)]
+        self.assertEqual(pops, [(2, 2, 2), (1, 1, 1), (0, 0, 0)])
 
 
 if __name__ == '__main__':
@@ -1,5 +1,8 @@
+import os
+import signal
+import tempfile
+import time
 import unittest
-import warnings
 import math
 from dalpy.arrays import Array, Array2D
 from dalpy.queues import Queue
@@ -7,8 +10,9 @@ from dalpy.stacks import Stack
 from dalpy.sets import Set
 from dalpy.linked_lists import SinglyLinkedListNode
 from dalpy.graphs import Graph, Vertex
-from dalpy.test_utils import dalpy_equals, dalpy_to_string, generic_test, build_and_run_watched_suite, UnexpectedReturnWarning
-from dalpy.factory_utils import make_array
+from dalpy.test_utils import dalpy_equals, dalpy_to_string, generic_test, behavior_test, build_and_run_watched_suite, \
+    UnexpectedReturnWarning, _Watcher
+from dalpy.factory_utils import make_array, make_queue
 from dalpy.trees import BinaryTreeNode, NaryTreeNode
 
 
@@ -17,37 +21,40 @@ class WarningTest(unittest.TestCase):
     def test_trigger_warning_and_pass(self):
         a = Array(0)
         b = Array(0)
-        with warnings.catch_warnings(record=True) as w:
+        with self.assertWarns(UnexpectedReturnWarning) as cm:
             generic_test(a, b, lambda x: make_array([1]), in_place=True)
-            assert len(w) == 1
-            assert issubclass(w[-1].category, UnexpectedReturnWarning)
-            assert "modify its argument(s)" in str(w[-1].message)
+        self.assertIn("modify its argument(s)", str(cm.warning))
 
     def test_trigger_warning_and_fail(self):
         a = Array(0)
         b = Array(1)
-        with warnings.catch_warnings(record=True) as w:
-            try:
-                generic_test(a, b, lambda x: make_array([1]), in_place=True)
-            except AssertionError:
-                pass
-            assert len(w) == 1
-            assert issubclass(w[-1].category, UnexpectedReturnWarning)
-            assert "modify its argument(s)" in str(w[-1].message)
+        # assertWarns only records the warning if no exception leaves it, so assertRaises is the inner context
+        with self.assertWarns(UnexpectedReturnWarning) as cm, self.assertRaises(AssertionError):
+            generic_test(a, b, lambda x: make_array([1]), in_place=True)
+        self.assertIn("modify its argument(s)", str(cm.warning))
 
     def test_trigger_warning_and_display(self):
         a = Array(0)
         b = Array(0)
         generic_test(a, b, lambda x: make_array([1]), in_place=True)
 
-    def test_trigger_warning_and_display2(self):
-        a = Array(0)
-        b = Array(0)
-        generic_test(a, b, lambda x: make_array([1]), in_place=True)
-
 
 class GenericTesterTest(unittest.TestCase):
-    
+
+    def setUp(self):
+        # build_and_run_watched_suite runs each test on its own, so a class fixture (setUpClass) would not be run
+        self.graph = Graph()
+        a = Vertex('a')
+        b = Vertex('b')
+        c = Vertex('c')
+        self.graph.add_vertex(a)
+        self.graph.add_vertex(b)
+        self.graph.add_vertex(c)
+        self.graph.add_edge(a, b, 0)
+        self.graph.add_edge(a, c, 0)
+        self.graph.add_edge(b, c, 2)
+        self.graph.add_edge(c, a, 3)
+
     def basic_generic_test(self):
         a = Array(1)
         b = Array(1)
@@ -91,17 +98,8 @@ class GenericTesterTest(unittest.TestCase):
             assert "2nd" in e.args[0], e.args[0]
     
     def test_multiple_larger(self):
-        g = Graph()
-        a = Vertex('a')
-        b = Vertex('b')
+        g = self.graph
         c = Vertex('c')
-        g.add_vertex(a)
-        g.add_vertex(b)
-        g.add_vertex(c)
-        g.add_edge(a, b, 0)
-        g.add_edge(a, c, 0)
-        g.add_edge(b, c, 2)
-        g.add_edge(c, a, 3)
         x = list(range(15))
         def fnc_that_modifies(graph, x):
             e = Vertex('e')
@@ -114,17 +112,8 @@ class GenericTesterTest(unittest.TestCase):
             assert 'e: c <1>' in e.args[0], e.args[0]
 
     def test_larger_object(self):
-        g = Graph()
-        a = Vertex('a')
-        b = Vertex('b')
+        g = self.graph
         c = Vertex('c')
-        g.add_vertex(a)
-        g.add_vertex(b)
-        g.add_vertex(c)
-        g.add_edge(a, b, 0)
-        g.add_edge(a, c, 0)
-        g.add_edge(b, c, 2)
-        g.add_edge(c, a, 3)
         def fnc_that_modifies(graph):
             e = Vertex('e')
             g.add_vertex(e)
@@ -148,6 +137,48 @@ class GenericTesterTest(unittest.TestCase):
             assert '[-1000, 7, 8, 9]' in e.args[0], e.args[0]
             assert '2nd' in e.args[0], e.args[0]
 
+    def test_requiring_no_modification_containers(self):
+        q = Queue()
+        q.enqueue(1)
+        q.enqueue(2)
+        s = Stack()
+        s.push(3)
+        generic_test([q, s, [4, (5, 6)]], 2, lambda x, y, z: x.size(), enforce_no_mod=True)
+        self.assertEqual(dalpy_to_string(q), 'Queue[1, 2]')
+        self.assertRaises(AssertionError, lambda: generic_test([q, s], 3, lambda x, y: y.pop(), enforce_no_mod=True))
+        self.assertRaises(AssertionError, lambda: generic_test([q, s], 1, lambda x, y: x.dequeue(),
+                                                               enforce_no_mod=[True, False]))
+
+
+
+class BehaviorTesterTest(unittest.TestCase):
+
+    def test_message_shows_result_when_returned(self):
+        class Bag:
+            def __init__(self):
+                self.items = []
+
+            def add(self, x):
+                self.items.append(x)
+                return self.items
+
+        bag = Bag()
+        with self.assertRaises(AssertionError) as cm:
+            behavior_test([([1], bag.add, 1), ([1, 2, 3], bag.add, 2)], bag)
+        self.assertEqual(cm.exception.args[0],
+                         'Behavior:\ninit Bag\n(add, 1) [1] ✓\n(add, 2) [1, 2] ✗\nexpected [1, 2, 3]')
+
+    def test_generic_message_shows_expected_before_call(self):
+        expected = [1]
+
+        def fnc_that_modifies_expected(x):
+            expected.append(2)
+            return x
+
+        with self.assertRaises(AssertionError) as cm:
+            generic_test(0, expected, fnc_that_modifies_expected)
+        self.assertEqual(cm.exception.args[0], 'Input: 0\nExpected: [1]\nOutput: 0')
+
 
 class DALPyEqualsTest(unittest.TestCase):
 
@@ -156,6 +187,23 @@ class DALPyEqualsTest(unittest.TestCase):
         y = 7.0
         assert dalpy_equals(x, y), f'y={y}, x={x}'
 
+    def test_queues_stacks_unmodified(self):
+        q1, q2, s1, s2 = Queue(), Queue(), Stack(), Stack()
+        for i in [1, 2, 3]:
+            q1.enqueue(i)
+            s1.push(i)
+        for i in [1, 4]:
+            q2.enqueue(i)
+            s2.push(i)
+        self.assertFalse(dalpy_equals(q1, q2))
+        self.assertFalse(dalpy_equals(q2, q1))
+        self.assertFalse(dalpy_equals(s1, s2))
+        self.assertEqual(dalpy_to_string([q1, q2]), '[Queue[1, 2, 3], Queue[1, 4]]')
+        self.assertEqual(dalpy_to_string([s1, s2]), '[Stack[1, 2, 3], Stack[1, 4]]')
+        q2.enqueue(3)
+        q2.dequeue()
+        self.assertTrue(dalpy_equals(q2, make_queue([4, 3])))
+
 
 class DALPyToStringTest(unittest.TestCase):
 
@@ -200,5 +248,95 @@ class DALPyToStringTest(unittest.TestCase):
 
     
 
+class _WatchedCases:
+    # nested so that these cases are only run by WatchedSuiteTest, not picked up by test discovery
+
+    class TimedTest(unittest.TestCase):
+
+        def test_fail(self):
+            self.assertEqual(1, 2)
+
+        def test_pass(self):
+            pass
+
+        def test_slow(self):
+            time.sleep(10)
+
+    class CrashingTest(unittest.TestCase):
+
+        def test_crash(self):
+            os._exit(1)
+
+        def test_pass(self):
+            pass
+
+
+class WatchedSuiteTest(unittest.TestCase):
+    # the ids start with the module name as the tests were imported, which depends on how this file is run
+    timed_test_ids = ','.join(_Watcher.parse_id(_WatchedCases.TimedTest(f'test_{name}').id())
+                              for name in ['fail', 'pass', 'slow'])
+
+    def test_timeout(self):
+        with tempfile.TemporaryDirectory() as d:
+            fp = os.path.join(d, 'grades.csv')
+            build_and_run_watched_suite([_WatchedCases.TimedTest], timeout=0.5, grading_file=fp)
+            with open(fp, encoding='utf-8') as f:
+                ids, results = f.read().split('\n')
+        self.assertEqual(ids, self.timed_test_ids)
+        self.assertEqual(results, '0,1,0')
+
+    @unittest.skipUnless(hasattr(signal, 'setitimer'), 'requires signal.setitimer')
+    def test_timeout_in_process(self):
+        with tempfile.TemporaryDirectory() as d:
+            fp = os.path.join(d, 'grades.csv')
+            build_and_run_watched_suite([_WatchedCases.TimedTest], timeout=0.5, grading_file=fp, in_process=True)
+            with open(fp, encoding='utf-8') as f:
+                ids, results = f.read().split('\n')
+        self.assertEqual(ids, self.timed_test_ids)
+        self.assertEqual(results, '0,1,0')
+
+    def test_processes(self):
+        with tempfile.TemporaryDirectory() as d:
+            fp = os.path.join(d, 'grades.csv')
+            build_and_run_watched_suite([_WatchedCases.TimedTest], timeout=0.5, grading_file=fp, processes=3)
+            with open(fp, encoding='utf-8') as f:
+                ids, results = f.read().split('\n')
+        self.assertEqual(ids, self.timed_test_ids)
+        self.assertEqual(results, '0,1,0')
+
+    def test_local_test_case(self):
+        class LocalTest(unittest.TestCase):
+
+            def test_fail(self):
+                self.assertEqual(1, 2)
+
+            def test_pass(self):
+                pass
+
+        for processes in [1, 2]:
+            with tempfile.TemporaryDirectory() as d:
+                fp = os.path.join(d, 'grades.csv')
+                build_and_run_watched_suite([LocalTest], timeout=5, grading_file=fp, processes=processes)
+                with open(fp, encoding='utf-8') as f:
+                    results = f.read().split('\n')[1]
+            self.assertEqual(results, '0,1')
+
+    def test_crash(self):
+        for timeout in [None, 30]:
+            start = time.monotonic()
+            with tempfile.TemporaryDirectory() as d:
+                fp = os.path.join(d, 'grades.csv')
+                build_and_run_watched_suite([_WatchedCases.CrashingTest], timeout=timeout, grading_file=fp, processes=2)
+                with open(fp, encoding='utf-8') as f:
+                    results = f.read().split('\n')[1]
+            self.assertEqual(results, '0,1')
+            self.assertLess(time.monotonic() - start, 10)
+
+    def test_invalid_processes(self):
+        for processes in [0, -1, None, 1.5, True]:
+            self.assertRaises(ValueError, lambda: build_and_run_watched_suite([], processes=processes))
+
+
 if __name__ == '__main__':
-    build_and_run_watched_suite([WarningTest, GenericTesterTest, DALPyEqualsTest, DALPyToStringTest])
+    build_and_run_watched_suite([WarningTest, GenericTesterTest, BehaviorTesterTest, DALPyEqualsTest, DALPyToStringTest,
+                                 WatchedSuiteTest])
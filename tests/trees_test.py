@@ -4,17 +4,9 @@ from dalpy.trees import depth, BinaryTreeNode, NaryTreeNode
 
 
 class DepthTest(unittest.TestCase):
-    def test_type(self):
-        self.assertRaises(TypeError, lambda: depth(BinaryTreeNode(3)))
-
-    def test_empty(self):
-        self.assertRaises(TypeError, lambda: depth(None))
-
-    def test_root(self):
-        a = NaryTreeNode('A')
-        self.assertEqual(depth(a), 0)
-
-    def test_slides_example(self):
+    def setUp(self):
+        # the tree from the slides. build_and_run_watched_suite runs each test on its own, so a class fixture
+        # (setUpClass) would not be run
         a = NaryTreeNode('A')
         b = NaryTreeNode('B')
         c = NaryTreeNode('C')
@@ -42,11 +34,25 @@ class DepthTest(unittest.TestCase):
         i.parent = f
         h.right_sibling = i
 
-        self.assertEqual(depth(b), 1)
-        self.assertEqual(depth(f), 2)
-        self.assertEqual(depth(i), 3)
+        self.nodes = {'a': a, 'b': b, 'c': c, 'd': d, 'e': e, 'f': f, 'g': g, 'h': h, 'i': i}
+
+    def test_type(self):
+        self.assertRaises(TypeError, lambda: depth(BinaryTreeNode(3)))
+
+    def test_empty(self):
+        self.assertRaises(TypeError, lambda: depth(None))
+
+    def test_root(self):
+        a = NaryTreeNode('A')
         self.assertEqual(depth(a), 0)
 
+    def test_slides_example(self):
+        nodes = self.nodes
+        self.assertEqual(depth(nodes['a']), 0)
+        self.assertEqual(depth(nodes['b']), 1)
+        self.assertEqual(depth(nodes['f']), 2)
+        self.assertEqual(depth(nodes['i']), 3)
+
 
 if __name__ == '__main__':
     unittest.main()